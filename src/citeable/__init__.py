@@ -1,6 +1,8 @@
 """citeable — structured BibTeX citations for cogent3 plugins."""
 
+from importlib import import_module
 from importlib import metadata as _metadata
+from typing import TYPE_CHECKING
 
 from citeable._entries import (
     Article,
@@ -13,9 +15,16 @@ from citeable._entries import (
     TechReport,
     Thesis,
 )
-from citeable._json import from_jsons, load_json, to_jsons, write_json
-from citeable._keys import assign_unique_keys, write_bibtex
-from citeable._parser import from_bibtex_string
+
+if TYPE_CHECKING:
+    # give type checkers the real signatures of the lazily imported helpers
+    from citeable._json import from_jsons, load_json, to_jsons, write_json
+    from citeable._keys import assign_unique_keys, write_bibtex
+    from citeable._parser import (
+        from_bibtex_file,
+        from_bibtex_stream,
+        from_bibtex_string,
+    )
 
 __version__ = _metadata.version("citeable")
 
@@ -31,6 +40,8 @@ __all__ = [
     "Thesis",
     "__version__",
     "assign_unique_keys",
+    "from_bibtex_file",
+    "from_bibtex_stream",
     "from_bibtex_string",
     "from_jsons",
     "load_json",
@@ -38,3 +49,34 @@ __all__ = [
     "write_bibtex",
     "write_json",
 ]
+
+# helper functions resolve lazily (PEP 562) so importing the entry classes
+# does not pay for compiling the parser patterns or loading json
+_LAZY_IMPORTS = {
+    "assign_unique_keys": "citeable._keys",
+    "from_bibtex_file": "citeable._parser",
+    "from_bibtex_stream": "citeable._parser",
+    "from_bibtex_string": "citeable._parser",
+    "from_jsons": "citeable._json",
+    "load_json": "citeable._json",
+    "to_jsons": "citeable._json",
+    "write_bibtex": "citeable._keys",
+    "write_json": "citeable._json",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import a helper from its submodule on first access."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(import_module(module_name), name)
+    # cache on the package so subsequent lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
@@ -2,14 +2,51 @@
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+import operator
+import sys
+from typing import Any, ClassVar
 
 from citeable._keys import generate_key
 from citeable._validate import extract_surname, require_field, require_non_empty_authors
 
+# interned so thesis_type comparisons and dict lookups hit pointer identity
+_THESIS_PHD = sys.intern("phd")
+_THESIS_MASTERS = sys.intern("masters")
+
+
+# per-field-name line prefixes precomputed so __str__ skips the format-spec
+# padding on every call
+_FIELD_PREFIX: dict[str, str] = {
+    name: f"  {name:<10}= {{"
+    for name in (
+        "author",
+        "title",
+        "journal",
+        "booktitle",
+        "publisher",
+        "institution",
+        "school",
+        "year",
+        "volume",
+        "number",
+        "pages",
+        "article_number",
+        "edition",
+        "editor",
+        "version",
+        "license",
+        "doi",
+        "url",
+        "note",
+    )
+}
+
 
-def _format_bibtex_field(name: str, value: str) -> str:
-    return f"  {name:<10}= {{{value}}},"
+def _format_bibtex_field(name: str, value: str | int) -> str:
+    prefix = _FIELD_PREFIX.get(name)
+    if prefix is None:
+        prefix = f"  {name:<10}= {{"
+    return f"{prefix}{value}}},"
 
 
 def _author_str(authors: list[str]) -> str:
@@ -21,29 +58,78 @@ def _author_summary(authors: list[str]) -> str:
     return f"{surname} et al." if len(authors) > 1 else surname
 
 
+_ELLIPSIS = "\u2026"
+
+
+# populated by CitationBase.__init_subclass__; class names are interned by
+# CPython, so interned lookup keys compare by identity inside the dict probe
+_ENTRY_TYPES: dict[str, type[CitationBase]] = {}
+
+
 def _title_excerpt(title: str, max_len: int = 50) -> str:
-    return title if len(title) <= max_len else title[:max_len] + "\u2026"
+    return title if len(title) <= max_len else title[:max_len] + _ELLIPSIS
 
 
-def _content_fields(obj: object, exclude: set[str]) -> tuple[object, ...]:
+def _content_fields(obj: CitationBase) -> tuple[object, ...]:
     """Return a tuple of content field values for equality/hashing.
 
-    Lists are converted to tuples so the result is hashable.
+    Reads the class's fixed ``_FIELDS`` in canonical order via a single
+    attrgetter call. Lists are converted to tuples so the result is hashable.
     """
-    vals: list[object] = []
-    vals.extend(
-        tuple(v) if isinstance(v, list) else v
-        for k, v in sorted(vars(obj).items())
-        if k not in exclude
-    )
-    return tuple(vals)
+    # author/editor are always plain lists, so the exact type check avoids
+    # isinstance's MRO walk
+    getter = type(obj)._GETTER  # noqa: SLF001 -- module-private helper for CitationBase
+    return tuple(tuple(v) if type(v) is list else v for v in getter(obj))
 
 
-_EXCLUDED: set[str] = {"key", "app"}
+class CitationBase:
+    """Base class for all citation entry types.
 
+    Not an ``abc.ABC``: a plain ``type`` metaclass keeps ``isinstance``
+    checks and instantiation off the ``ABCMeta`` slow path.
+    """
 
-class CitationBase(ABC):
-    """Abstract base class for all citation entry types."""
+    #: content field names in canonical order; excludes ``key``/``app`` and
+    #: private caches so neither participates in equality or hashing
+    _FIELDS: ClassVar[tuple[str, ...]]
+    _GETTER: ClassVar[Any]
+
+    #: BibTeX entry type emitted by ``__str__`` (Thesis overrides the method)
+    _BIBTEX_TYPE: ClassVar[str]
+    #: field names in BibTeX emission order; ``None`` values are skipped
+    _BIBTEX_FIELDS: ClassVar[tuple[str, ...]]
+    #: field names in ``__repr__`` order; ``None`` values are skipped
+    _REPR_FIELDS: ClassVar[tuple[str, ...]]
+
+    #: fields the constructor rejects when ``None``; checked on the
+    #: trusted deserialisation path before bypassing ``__init__``
+    _REQUIRED_FIELDS: ClassVar[tuple[str, ...]] = ()
+
+    #: lazily populated slots, reset together when bypassing __init__
+    _CACHE_SLOTS: ClassVar[tuple[str, ...]] = (
+        "_hash",
+        "_content_cache",
+        "_author_joined",
+        "_editor_joined",
+        "_summary",
+    )
+
+    __slots__ = (
+        "_author_joined",
+        "_auto_key",
+        "_content_cache",
+        "_editor_joined",
+        "_hash",
+        "_summary",
+        "app",
+        "author",
+        "doi",
+        "key",
+        "note",
+        "title",
+        "url",
+        "year",
+    )
 
     author: list[str]
     title: str
@@ -53,6 +139,12 @@ class CitationBase(ABC):
     note: str | None
     key: str
     app: str | None
+    _hash: int | None
+    _content_cache: tuple[object, ...] | None
+    _author_joined: str | None
+    _summary: tuple[str, str] | None
+    _editor_joined: str | None
+    _auto_key: bool
 
     def _init_base(
         self,
@@ -74,56 +166,126 @@ class CitationBase(ABC):
         self.doi = doi
         self.url = url
         self.note = note
-        self.key = key if key is not None else generate_key(author, year)
+        auto_key = generate_key(author, year)
+        self.key = key if key is not None else auto_key
         self.app = app
+        # record once whether the key matches the generated one so __repr__
+        # does not have to regenerate it
+        self._auto_key = self.key == auto_key
+        self._hash = None
+        self._content_cache = None
+        self._author_joined = None
+        self._editor_joined = None
+        self._summary = None
+
+    def _canonical(self) -> tuple[object, ...]:
+        """Return the cached canonical content tuple used by ``__eq__``/``__hash__``."""
+        cached = self._content_cache
+        if cached is None:
+            cached = _content_fields(self)
+            self._content_cache = cached
+        return cached
 
     def __eq__(self, other: object) -> bool:
         if self is other:
             return True
         if type(self) is not type(other):
             return NotImplemented
-        return _content_fields(self, _EXCLUDED) == _content_fields(other, _EXCLUDED)
+        if hash(self) != hash(other):
+            return False
+        return self._canonical() == other._canonical()
 
     def __hash__(self) -> int:
-        return hash((type(self).__name__, _content_fields(self, _EXCLUDED)))
+        # Citations are effectively immutable after construction (only ``key``,
+        # which is excluded from content, is reassigned), so the hash is
+        # computed once and memoized.
+        h = self._hash
+        if h is None:
+            h = hash((type(self).__name__, self._canonical()))
+            self._hash = h
+        return h
 
     def summary(self) -> tuple[str, str]:
-        """Return ``(app_name, citation_string)``."""
-        app_name = self.app if self.app is not None else ""
-        auth = _author_summary(self.author)
-        excerpt = _title_excerpt(self.title)
-        return (app_name, f"{auth} {self.year} {excerpt}")
+        """Return ``(app_name, citation_string)``, cached after first call."""
+        cached = self._summary
+        if cached is None:
+            app_name = self.app if self.app is not None else ""
+            auth = _author_summary(self.author)
+            excerpt = _title_excerpt(self.title)
+            cached = (app_name, f"{auth} {self.year} {excerpt}")
+            self._summary = cached
+        return cached
 
     def __repr__(self) -> str:
         fields = self._repr_fields()
-        auto_key = generate_key(self.author, self.year)
-        if self.key != auto_key:
+        if not self._auto_key:
             fields.insert(0, ("key", self.key))
         parts = [f"    {name}={value!r}," for name, value in fields]
         body = "\n".join(parts)
         return f"{type(self).__name__}(\n{body}\n)"
 
-    def _append_common_bibtex(self, lines: list[str]) -> None:
-        """Append doi/url/note BibTeX fields if set."""
-        if self.doi is not None:
-            lines.append(_format_bibtex_field("doi", self.doi))
-        if self.url is not None:
-            lines.append(_format_bibtex_field("url", self.url))
-        if self.note is not None:
-            lines.append(_format_bibtex_field("note", self.note))
-
-    def _append_common_optional_repr(self, fields: list[tuple[str, object]]) -> None:
-        """Append doi/url/note to repr field list if set."""
-        if self.doi is not None:
-            fields.append(("doi", self.doi))
-        if self.url is not None:
-            fields.append(("url", self.url))
-        if self.note is not None:
-            fields.append(("note", self.note))
+    def _authors_bibtex(self) -> str:
+        """Return the ``" and "``-joined author string, cached after first use."""
+        joined = self._author_joined
+        if joined is None:
+            joined = _author_str(self.author)
+            self._author_joined = joined
+        return joined
+
+    def _bibtex_type(self) -> str:
+        return self._BIBTEX_TYPE
+
+    def __str__(self) -> str:
+        lines = [f"@{self._bibtex_type()}{{{self.key},"]
+        for name in self._BIBTEX_FIELDS:
+            value: object = getattr(self, name)
+            if value is None:
+                continue
+            if name == "author":
+                value = self._authors_bibtex()
+            elif name == "editor":
+                joined = self._editor_joined
+                if joined is None:
+                    joined = _author_str(value)  # type: ignore[arg-type]
+                    self._editor_joined = joined
+                value = joined
+            lines.append(_format_bibtex_field(name, value))  # type: ignore[arg-type]
+        lines.append("}")
+        return "\n".join(lines)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401 -- hook signature
+        super().__init_subclass__(**kwargs)
+        # concrete entry types declare _FIELDS; register them so from_dict
+        # dispatches without a hand-maintained table
+        if "_FIELDS" in cls.__dict__:
+            _ENTRY_TYPES[cls.__name__] = cls
+        # generate a straight-line to_dict whose bytecode builds the dict
+        # literal directly, instead of looping over _FIELDS with getattr
+        if "_FIELDS" in cls.__dict__ and "to_dict" not in cls.__dict__:
+            items = ", ".join(
+                [f'"type": "{cls.__name__}"']
+                + [f'"{name}": self.{name}' for name in cls._FIELDS]
+                + ['"key": self.key', '"app": self.app']
+            )
+            namespace: dict[str, Any] = {}
+            exec(  # noqa: S102 -- source is built from trusted field names
+                f"def to_dict(self) -> dict[str, object]:\n    return {{{items}}}",
+                namespace,
+            )
+            generated = namespace["to_dict"]
+            generated.__doc__ = CitationBase.to_dict.__doc__
+            generated.__qualname__ = f"{cls.__name__}.to_dict"
+            # deliberate: swap in the specialised method generated above
+            cls.to_dict = generated  # type: ignore[method-assign]
 
     def to_dict(self) -> dict[str, object]:
         """Return a JSON-serialisable dict including a ``"type"`` discriminator."""
-        return {"type": type(self).__name__, **vars(self)}
+        d: dict[str, object] = {"type": type(self).__name__}
+        for name in self._FIELDS:
+            d[name] = getattr(self, name)
+        d["key"] = self.key
+        d["app"] = self.app
+        return d
 
     @classmethod
     def from_dict(cls, data: dict[str, object]) -> CitationBase:
@@ -136,15 +298,81 @@ class CitationBase(ABC):
         if type_name is None:
             msg = "dict is missing required 'type' key"
             raise ValueError(msg)
-        entry_cls = _ENTRY_TYPES.get(str(type_name))
+        entry_cls = _ENTRY_TYPES.get(sys.intern(str(type_name)))
         if entry_cls is None:
             msg = f"unknown citation type {type_name!r}"
             raise ValueError(msg)
         return entry_cls(**data)
 
-    @abstractmethod
+    @classmethod
+    def _from_trusted_dict(cls, data: dict[str, object]) -> CitationBase:
+        """Reconstruct a citation from a dict produced by :meth:`to_dict`.
+
+        Dicts shaped exactly like :meth:`to_dict` output bypass ``__init__``
+        and its validators; anything else — missing or extra keys, an empty
+        author list — is handed to :meth:`from_dict` so hand-edited input
+        fails with the constructor's usual errors. Raises ``ValueError`` for
+        a missing or unknown type either way.
+        """
+        type_name = data.get("type")
+        if type_name is None:
+            msg = "dict is missing required 'type' key"
+            raise ValueError(msg)
+        entry_cls = _ENTRY_TYPES.get(sys.intern(str(type_name)))
+        if entry_cls is None:
+            msg = f"unknown citation type {type_name!r}"
+            raise ValueError(msg)
+        # "type" + _FIELDS + "key" + "app" is exactly what to_dict emits
+        if (
+            len(data) != len(entry_cls._FIELDS) + 3  # noqa: SLF001
+            or not data.get("author")
+            or not entry_cls._trusted_values_ok(data)  # noqa: SLF001
+        ):
+            return entry_cls.from_dict(data)
+        obj = entry_cls.__new__(entry_cls)
+        try:
+            for name in entry_cls._FIELDS:  # noqa: SLF001 -- entry_cls is our own subclass
+                setattr(obj, name, data[name])
+            setattr(obj, "key", data["key"])  # noqa: B010
+            setattr(obj, "app", data["app"])  # noqa: B010
+        except KeyError:
+            # right size but wrong keys; let the constructor report it
+            return entry_cls.from_dict(data)
+        obj._auto_key = obj.key == generate_key(obj.author, obj.year)  # noqa: SLF001
+        for name in entry_cls._CACHE_SLOTS:  # noqa: SLF001
+            setattr(obj, name, None)
+        return obj
+
+    @classmethod
+    def _trusted_values_ok(cls, data: dict[str, object]) -> bool:
+        """Return ``True`` if *data* passes the value checks ``__init__`` applies."""
+        return all(data.get(name) is not None for name in cls._REQUIRED_FIELDS)
+
+    def _copy(self) -> CitationBase:
+        """Return a copy with fresh list fields and empty caches.
+
+        Used by the memoized parser so call-site mutation cannot corrupt
+        cached instances.
+        """
+        cls = type(self)
+        obj = cls.__new__(cls)
+        for name in cls._FIELDS:
+            v = getattr(self, name)
+            setattr(obj, name, list(v) if type(v) is list else v)
+        setattr(obj, "key", self.key)  # noqa: B010
+        setattr(obj, "app", self.app)  # noqa: B010
+        obj._auto_key = self._auto_key  # noqa: SLF001 -- obj is the same class as self
+        for name in cls._CACHE_SLOTS:
+            setattr(obj, name, None)
+        return obj
+
     def _repr_fields(self) -> list[tuple[str, object]]:
-        """Return the list of ``(name, value)`` pairs for ``__repr__``."""
+        """Return ``(name, value)`` pairs for ``__repr__``, skipping ``None``."""
+        return [
+            (name, value)
+            for name in self._REPR_FIELDS
+            if (value := getattr(self, name)) is not None
+        ]
 
 
 # Keep Citation as a public alias for the base class.
@@ -154,6 +382,54 @@ Citation = CitationBase
 class Article(CitationBase):
     """An ``@article`` BibTeX entry."""
 
+    _FIELDS = (
+        "article_number",
+        "author",
+        "doi",
+        "journal",
+        "note",
+        "number",
+        "pages",
+        "title",
+        "url",
+        "volume",
+        "year",
+    )
+    _GETTER = operator.attrgetter(*_FIELDS)
+
+    _REPR_FIELDS = (
+        "author",
+        "title",
+        "year",
+        "journal",
+        "volume",
+        "pages",
+        "article_number",
+        "number",
+        "doi",
+        "url",
+        "note",
+    )
+
+    _BIBTEX_TYPE = "article"
+    _BIBTEX_FIELDS = (
+        "author",
+        "title",
+        "journal",
+        "year",
+        "volume",
+        "number",
+        "pages",
+        "article_number",
+        "doi",
+        "url",
+        "note",
+    )
+
+    _REQUIRED_FIELDS = ("journal",)
+
+    __slots__ = ("article_number", "journal", "number", "pages", "volume")
+
     journal: str
     volume: int | None
     pages: str | None
@@ -188,48 +464,52 @@ class Article(CitationBase):
         self.article_number = article_number
         self.number = number
 
-    def __str__(self) -> str:
-        lines = [
-            f"@article{{{self.key},",
-            _format_bibtex_field("author", _author_str(self.author)),
-            _format_bibtex_field("title", self.title),
-            _format_bibtex_field("journal", self.journal),
-            _format_bibtex_field("year", str(self.year)),
-        ]
-        if self.volume is not None:
-            lines.append(_format_bibtex_field("volume", str(self.volume)))
-        if self.number is not None:
-            lines.append(_format_bibtex_field("number", str(self.number)))
-        if self.pages is not None:
-            lines.append(_format_bibtex_field("pages", self.pages))
-        if self.article_number is not None:
-            lines.append(_format_bibtex_field("article_number", self.article_number))
-        self._append_common_bibtex(lines)
-        lines.append("}")
-        return "\n".join(lines)
-
-    def _repr_fields(self) -> list[tuple[str, object]]:
-        fields: list[tuple[str, object]] = [
-            ("author", self.author),
-            ("title", self.title),
-            ("year", self.year),
-            ("journal", self.journal),
-        ]
-        if self.volume is not None:
-            fields.append(("volume", self.volume))
-        if self.pages is not None:
-            fields.append(("pages", self.pages))
-        if self.article_number is not None:
-            fields.append(("article_number", self.article_number))
-        if self.number is not None:
-            fields.append(("number", self.number))
-        self._append_common_optional_repr(fields)
-        return fields
-
 
 class Book(CitationBase):
     """A ``@book`` BibTeX entry."""
 
+    _FIELDS = (
+        "author",
+        "doi",
+        "edition",
+        "editor",
+        "note",
+        "publisher",
+        "title",
+        "url",
+        "year",
+    )
+    _GETTER = operator.attrgetter(*_FIELDS)
+
+    _REPR_FIELDS = (
+        "author",
+        "title",
+        "year",
+        "publisher",
+        "edition",
+        "editor",
+        "doi",
+        "url",
+        "note",
+    )
+
+    _BIBTEX_TYPE = "book"
+    _BIBTEX_FIELDS = (
+        "author",
+        "title",
+        "publisher",
+        "year",
+        "edition",
+        "editor",
+        "doi",
+        "url",
+        "note",
+    )
+
+    _REQUIRED_FIELDS = ("publisher",)
+
+    __slots__ = ("edition", "editor", "publisher")
+
     publisher: str
     edition: str | None
     editor: list[str] | None
@@ -258,40 +538,55 @@ class Book(CitationBase):
         self.edition = edition
         self.editor = editor
 
-    def __str__(self) -> str:
-        lines = [
-            f"@book{{{self.key},",
-            _format_bibtex_field("author", _author_str(self.author)),
-            _format_bibtex_field("title", self.title),
-            _format_bibtex_field("publisher", self.publisher),
-            _format_bibtex_field("year", str(self.year)),
-        ]
-        if self.edition is not None:
-            lines.append(_format_bibtex_field("edition", self.edition))
-        if self.editor is not None:
-            lines.append(_format_bibtex_field("editor", _author_str(self.editor)))
-        self._append_common_bibtex(lines)
-        lines.append("}")
-        return "\n".join(lines)
-
-    def _repr_fields(self) -> list[tuple[str, object]]:
-        fields: list[tuple[str, object]] = [
-            ("author", self.author),
-            ("title", self.title),
-            ("year", self.year),
-            ("publisher", self.publisher),
-        ]
-        if self.edition is not None:
-            fields.append(("edition", self.edition))
-        if self.editor is not None:
-            fields.append(("editor", self.editor))
-        self._append_common_optional_repr(fields)
-        return fields
-
 
 class InProceedings(CitationBase):
     """An ``@inproceedings`` BibTeX entry."""
 
+    _FIELDS = (
+        "author",
+        "booktitle",
+        "doi",
+        "editor",
+        "note",
+        "pages",
+        "publisher",
+        "title",
+        "url",
+        "year",
+    )
+    _GETTER = operator.attrgetter(*_FIELDS)
+
+    _REPR_FIELDS = (
+        "author",
+        "title",
+        "year",
+        "booktitle",
+        "pages",
+        "publisher",
+        "editor",
+        "doi",
+        "url",
+        "note",
+    )
+
+    _BIBTEX_TYPE = "inproceedings"
+    _BIBTEX_FIELDS = (
+        "author",
+        "title",
+        "booktitle",
+        "year",
+        "pages",
+        "publisher",
+        "editor",
+        "doi",
+        "url",
+        "note",
+    )
+
+    _REQUIRED_FIELDS = ("booktitle",)
+
+    __slots__ = ("booktitle", "editor", "pages", "publisher")
+
     booktitle: str
     pages: str | None
     publisher: str | None
@@ -323,44 +618,49 @@ class InProceedings(CitationBase):
         self.publisher = publisher
         self.editor = editor
 
-    def __str__(self) -> str:
-        lines = [
-            f"@inproceedings{{{self.key},",
-            _format_bibtex_field("author", _author_str(self.author)),
-            _format_bibtex_field("title", self.title),
-            _format_bibtex_field("booktitle", self.booktitle),
-            _format_bibtex_field("year", str(self.year)),
-        ]
-        if self.pages is not None:
-            lines.append(_format_bibtex_field("pages", self.pages))
-        if self.publisher is not None:
-            lines.append(_format_bibtex_field("publisher", self.publisher))
-        if self.editor is not None:
-            lines.append(_format_bibtex_field("editor", _author_str(self.editor)))
-        self._append_common_bibtex(lines)
-        lines.append("}")
-        return "\n".join(lines)
-
-    def _repr_fields(self) -> list[tuple[str, object]]:
-        fields: list[tuple[str, object]] = [
-            ("author", self.author),
-            ("title", self.title),
-            ("year", self.year),
-            ("booktitle", self.booktitle),
-        ]
-        if self.pages is not None:
-            fields.append(("pages", self.pages))
-        if self.publisher is not None:
-            fields.append(("publisher", self.publisher))
-        if self.editor is not None:
-            fields.append(("editor", self.editor))
-        self._append_common_optional_repr(fields)
-        return fields
-
 
 class TechReport(CitationBase):
     """A ``@techreport`` BibTeX entry."""
 
+    _FIELDS = (
+        "author",
+        "doi",
+        "institution",
+        "note",
+        "number",
+        "title",
+        "url",
+        "year",
+    )
+    _GETTER = operator.attrgetter(*_FIELDS)
+
+    _REPR_FIELDS = (
+        "author",
+        "title",
+        "year",
+        "institution",
+        "number",
+        "doi",
+        "url",
+        "note",
+    )
+
+    _BIBTEX_TYPE = "techreport"
+    _BIBTEX_FIELDS = (
+        "author",
+        "title",
+        "institution",
+        "year",
+        "number",
+        "doi",
+        "url",
+        "note",
+    )
+
+    _REQUIRED_FIELDS = ("institution",)
+
+    __slots__ = ("institution", "number")
+
     institution: str
     number: str | None
 
@@ -386,36 +686,40 @@ class TechReport(CitationBase):
         self.institution = institution
         self.number = number
 
-    def __str__(self) -> str:
-        lines = [
-            f"@techreport{{{self.key},",
-            _format_bibtex_field("author", _author_str(self.author)),
-            _format_bibtex_field("title", self.title),
-            _format_bibtex_field("institution", self.institution),
-            _format_bibtex_field("year", str(self.year)),
-        ]
-        if self.number is not None:
-            lines.append(_format_bibtex_field("number", self.number))
-        self._append_common_bibtex(lines)
-        lines.append("}")
-        return "\n".join(lines)
-
-    def _repr_fields(self) -> list[tuple[str, object]]:
-        fields: list[tuple[str, object]] = [
-            ("author", self.author),
-            ("title", self.title),
-            ("year", self.year),
-            ("institution", self.institution),
-        ]
-        if self.number is not None:
-            fields.append(("number", self.number))
-        self._append_common_optional_repr(fields)
-        return fields
-
 
 class Thesis(CitationBase):
     """A ``@phdthesis`` or ``@mastersthesis`` BibTeX entry."""
 
+    _FIELDS = (
+        "author",
+        "doi",
+        "note",
+        "school",
+        "thesis_type",
+        "title",
+        "url",
+        "year",
+    )
+    _GETTER = operator.attrgetter(*_FIELDS)
+
+    _REPR_FIELDS = (
+        "author",
+        "title",
+        "year",
+        "school",
+        "thesis_type",
+        "doi",
+        "url",
+        "note",
+    )
+
+    # the entry type depends on thesis_type, so _bibtex_type is overridden
+    _BIBTEX_FIELDS = ("author", "title", "school", "year", "doi", "url", "note")
+
+    _REQUIRED_FIELDS = ("school", "thesis_type")
+
+    __slots__ = ("school", "thesis_type")
+
     school: str
     thesis_type: str
 
@@ -435,7 +739,7 @@ class Thesis(CitationBase):
     ) -> None:
         require_field(school, "school", "Thesis")
         require_field(thesis_type, "thesis_type", "Thesis")
-        if thesis_type not in ("phd", "masters"):
+        if thesis_type not in (_THESIS_PHD, _THESIS_MASTERS):
             msg = f"Thesis thesis_type must be 'phd' or 'masters'; got {thesis_type!r}"
             raise ValueError(msg)
 
@@ -443,36 +747,63 @@ class Thesis(CitationBase):
             author, title, year, doi=doi, url=url, note=note, key=key, app=app
         )
         self.school = school
-        self.thesis_type = thesis_type
+        self.thesis_type = sys.intern(thesis_type)
 
-    def __str__(self) -> str:
-        bib_type = "phdthesis" if self.thesis_type == "phd" else "mastersthesis"
-        lines = [
-            f"@{bib_type}{{{self.key},",
-            _format_bibtex_field("author", _author_str(self.author)),
-            _format_bibtex_field("title", self.title),
-            _format_bibtex_field("school", self.school),
-            _format_bibtex_field("year", str(self.year)),
-        ]
-        self._append_common_bibtex(lines)
-        lines.append("}")
-        return "\n".join(lines)
+    def _bibtex_type(self) -> str:
+        return "phdthesis" if self.thesis_type == _THESIS_PHD else "mastersthesis"
 
-    def _repr_fields(self) -> list[tuple[str, object]]:
-        fields: list[tuple[str, object]] = [
-            ("author", self.author),
-            ("title", self.title),
-            ("year", self.year),
-            ("school", self.school),
-            ("thesis_type", self.thesis_type),
-        ]
-        self._append_common_optional_repr(fields)
-        return fields
+    @classmethod
+    def _trusted_values_ok(cls, data: dict[str, object]) -> bool:
+        # thesis_type also has a closed value set
+        return super()._trusted_values_ok(data) and data.get("thesis_type") in (
+            _THESIS_PHD,
+            _THESIS_MASTERS,
+        )
 
 
 class Software(CitationBase):
     """A ``@software`` BibTeX entry."""
 
+    _FIELDS = (
+        "author",
+        "doi",
+        "license",
+        "note",
+        "publisher",
+        "title",
+        "url",
+        "version",
+        "year",
+    )
+    _GETTER = operator.attrgetter(*_FIELDS)
+
+    _REPR_FIELDS = (
+        "author",
+        "title",
+        "year",
+        "publisher",
+        "version",
+        "license",
+        "doi",
+        "url",
+        "note",
+    )
+
+    _BIBTEX_TYPE = "software"
+    _BIBTEX_FIELDS = (
+        "author",
+        "title",
+        "year",
+        "publisher",
+        "version",
+        "license",
+        "doi",
+        "url",
+        "note",
+    )
+
+    __slots__ = ("license", "publisher", "version")
+
     publisher: str | None
     version: str | None
     license: str | None
@@ -499,42 +830,20 @@ class Software(CitationBase):
         self.version = version
         self.license = license
 
-    def __str__(self) -> str:
-        lines = [
-            f"@software{{{self.key},",
-            _format_bibtex_field("author", _author_str(self.author)),
-            _format_bibtex_field("title", self.title),
-            _format_bibtex_field("year", str(self.year)),
-        ]
-        if self.publisher is not None:
-            lines.append(_format_bibtex_field("publisher", self.publisher))
-        if self.version is not None:
-            lines.append(_format_bibtex_field("version", self.version))
-        if self.license is not None:
-            lines.append(_format_bibtex_field("license", self.license))
-        self._append_common_bibtex(lines)
-        lines.append("}")
-        return "\n".join(lines)
-
-    def _repr_fields(self) -> list[tuple[str, object]]:
-        fields: list[tuple[str, object]] = [
-            ("author", self.author),
-            ("title", self.title),
-            ("year", self.year),
-        ]
-        if self.publisher is not None:
-            fields.append(("publisher", self.publisher))
-        if self.version is not None:
-            fields.append(("version", self.version))
-        if self.license is not None:
-            fields.append(("license", self.license))
-        self._append_common_optional_repr(fields)
-        return fields
-
 
 class Misc(CitationBase):
     """A ``@misc`` BibTeX entry."""
 
+    _FIELDS = ("author", "doi", "note", "title", "url", "year")
+    _GETTER = operator.attrgetter(*_FIELDS)
+
+    _REPR_FIELDS = ("author", "title", "year", "doi", "url", "note")
+
+    _BIBTEX_TYPE = "misc"
+    _BIBTEX_FIELDS = ("author", "title", "year", "doi", "url", "note")
+
+    __slots__ = ()
+
     def __init__(
         self,
         author: list[str],
@@ -550,34 +859,3 @@ class Misc(CitationBase):
         self._init_base(
             author, title, year, doi=doi, url=url, note=note, key=key, app=app
         )
-
-    def __str__(self) -> str:
-        lines = [
-            f"@misc{{{self.key},",
-            _format_bibtex_field("author", _author_str(self.author)),
-            _format_bibtex_field("title", self.title),
-            _format_bibtex_field("year", str(self.year)),
-        ]
-        self._append_common_bibtex(lines)
-        lines.append("}")
-        return "\n".join(lines)
-
-    def _repr_fields(self) -> list[tuple[str, object]]:
-        fields: list[tuple[str, object]] = [
-            ("author", self.author),
-            ("title", self.title),
-            ("year", self.year),
-        ]
-        self._append_common_optional_repr(fields)
-        return fields
-
-
-_ENTRY_TYPES: dict[str, type[CitationBase]] = {
-    "Article": Article,
-    "Book": Book,
-    "InProceedings": InProceedings,
-    "TechReport": TechReport,
-    "Thesis": Thesis,
-    "Software": Software,
-    "Misc": Misc,
-}
@@ -4,27 +4,57 @@ from __future__ import annotations
 
 import json
 import pathlib
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+try:  # optional speedup; the stdlib encoder is the fallback
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from citeable._entries import CitationBase
 
 
 def to_jsons(citations: Iterable[CitationBase]) -> str:
     """Return a JSON string from an iterable of citations."""
-    return json.dumps([c.to_dict() for c in citations])
+    cits = citations if isinstance(citations, Sequence) else list(citations)
+    # preallocate to the known length; a comprehension grows by appends
+    payload: list[dict[str, object]] = [{}] * len(cits)
+    for i, c in enumerate(cits):
+        payload[i] = c.to_dict()
+    if orjson is not None:
+        return orjson.dumps(payload).decode()
+    return json.dumps(payload)
 
 
 def from_jsons(data: str) -> list[CitationBase]:
     """Return a list of citations from a JSON string."""
-    return [CitationBase.from_dict(d) for d in json.loads(data)]
+    loads = json.loads if orjson is None else orjson.loads
+    # dicts produced by to_dict are complete, so skip constructor validation
+    return [CitationBase._from_trusted_dict(d) for d in loads(data)]  # noqa: SLF001
 
 
 def write_json(*, citations: Iterable[CitationBase], path: str | pathlib.Path) -> None:
     """Write citations to a JSON file at *path*."""
-    pathlib.Path(path).write_text(to_jsons(citations))
+    if orjson is not None:
+        # encode one entry at a time so peak memory is a single record,
+        # not the whole document
+        with pathlib.Path(path).open("wb") as out:
+            out.write(b"[")
+            for i, c in enumerate(citations):
+                if i:
+                    out.write(b",")
+                out.write(orjson.dumps(c.to_dict()))
+            out.write(b"]")
+        return
+    # stream encoder chunks straight to the file rather than building the
+    # full document in memory first
+    encoder = json.JSONEncoder()
+    with pathlib.Path(path).open("w", encoding="utf-8") as out:
+        out.writelines(encoder.iterencode([c.to_dict() for c in citations]))
 
 
 def load_json(path: str | pathlib.Path) -> list[CitationBase]:
@@ -48,6 +48,8 @@ def assign_unique_keys(citations: list[CitationBase]) -> list[CitationBase]:
             raise ValueError(msg)
         for i, c in enumerate(group):
             c.key = f"{key}.{string.ascii_lowercase[i]}"
+            # the suffixed key no longer matches the generated one
+            c._auto_key = False  # noqa: SLF001 -- keep repr's auto-key flag accurate
 
     return unique
 
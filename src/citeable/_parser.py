@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import functools
+import mmap
 import re
-from collections.abc import Callable
+import sys
+from collections.abc import Callable, Iterator
+from pathlib import Path
 from typing import Any
 
 from citeable._entries import (
+    _THESIS_MASTERS,
+    _THESIS_PHD,
     Article,
     Book,
     CitationBase,
@@ -17,35 +23,53 @@ from citeable._entries import (
     Thesis,
 )
 
-_ENTRY_START_RE = re.compile(r"@(\w+)\s*\{")
+_ENTRY_START_RE = re.compile(rb"@(\w+)\s*\{")
 
+# keys are interned so lookups built from parsed input hit the identity
+# fast path inside dict comparison
 _TYPE_MAP: dict[str, type[CitationBase]] = {
-    "article": Article,
-    "book": Book,
-    "inproceedings": InProceedings,
-    "techreport": TechReport,
-    "phdthesis": Thesis,
-    "mastersthesis": Thesis,
-    "software": Software,
-    "misc": Misc,
+    sys.intern(name): cls
+    for name, cls in (
+        ("article", Article),
+        ("book", Book),
+        ("inproceedings", InProceedings),
+        ("techreport", TechReport),
+        ("phdthesis", Thesis),
+        ("mastersthesis", Thesis),
+        ("software", Software),
+        ("misc", Misc),
+    )
 }
 
 
-def _extract_entries(bibtex: str) -> list[tuple[str, str, str]]:
-    """Return list of ``(entry_type, cite_key, body)`` tuples."""
-    results: list[tuple[str, str, str]] = []
-    for m in _ENTRY_START_RE.finditer(bibtex):
-        entry_type = m.group(1)
+def _iter_entries(buf: bytes | mmap.mmap) -> Iterator[tuple[str, str, str]]:
+    """Yield ``(entry_type, cite_key, body)`` tuples from a UTF-8 buffer.
+
+    Scanning works on bytes: braces are ASCII, so byte offsets are valid
+    inside multi-byte UTF-8 sequences, and ``bytes.find`` avoids creating a
+    string object per inspected character.
+    """
+    size = len(buf)
+    for m in _ENTRY_START_RE.finditer(buf):
+        entry_type = m.group(1).decode()
         start = m.end()
         depth = 1
         pos = start
-        while pos < len(bibtex) and depth > 0:
-            if bibtex[pos] == "{":
-                depth += 1
-            elif bibtex[pos] == "}":
+        # jump between braces with bytes.find rather than stepping one
+        # character at a time in Python
+        while depth > 0:
+            next_close = buf.find(b"}", pos)
+            if next_close == -1:
+                pos = size
+                break
+            next_open = buf.find(b"{", pos, next_close)
+            if next_open == -1:
                 depth -= 1
-            pos += 1
-        body = bibtex[start : pos - 1]
+                pos = next_close + 1
+            else:
+                depth += 1
+                pos = next_open + 1
+        body = buf[start : pos - 1].decode()
         comma_idx = body.find(",")
         if comma_idx == -1:
             cite_key = body.strip()
@@ -53,24 +77,62 @@ def _extract_entries(bibtex: str) -> list[tuple[str, str, str]]:
         else:
             cite_key = body[:comma_idx].strip()
             fields_body = body[comma_idx + 1 :]
-        results.append((entry_type, cite_key, fields_body))
-    return results
+        yield (entry_type, cite_key, fields_body)
 
 
+def _extract_entries(bibtex: str) -> list[tuple[str, str, str]]:
+    """Return list of ``(entry_type, cite_key, body)`` tuples."""
+    return list(_iter_entries(bibtex.encode()))
+
+
+@functools.lru_cache(maxsize=4096)
 def _normalise_author(name: str) -> str:
-    """Normalise an author name to ``"Last, First"`` format."""
+    """Normalise an author name to ``"Last, First"`` format.
+
+    Pure function; memoized because the same authors recur throughout a
+    bibliography. Brace-protected names (e.g. corporate authors) are
+    returned verbatim.
+    """
     name = name.strip()
-    if "," in name:
+    if name.startswith("{") or "," in name:
         return name
     parts = name.split()
     return name if len(parts) <= 1 else f"{parts[-1]}, {' '.join(parts[:-1])}"
 
 
+def _split_authors(raw: str) -> list[str]:
+    """Split an author field on ``" and "`` delimiters at brace depth zero.
+
+    Delimiters inside ``{...}`` groups are part of the name. The scan jumps
+    between delimiters with ``str.find`` and counts intervening braces with
+    ``str.count``, so no per-character Python loop is involved.
+    """
+    if "{" not in raw:
+        return raw.split(" and ")
+    parts: list[str] = []
+    depth = 0
+    start = 0
+    pos = 0
+    while True:
+        idx = raw.find(" and ", pos)
+        if idx == -1:
+            break
+        depth += raw.count("{", pos, idx) - raw.count("}", pos, idx)
+        if depth == 0:
+            parts.append(raw[start:idx])
+            start = idx + 5
+        pos = idx + 5
+    parts.append(raw[start:])
+    return parts
+
+
 def _parse_authors(raw: str) -> list[str]:
-    return [_normalise_author(a) for a in raw.split(" and ")]
+    return [_normalise_author(a) for a in _split_authors(raw)]
 
 
-_FIELD_START_RE = re.compile(r"^\s*(\w+)\s*=\s*", re.MULTILINE)
+# field names are ASCII in BibTeX; re.ASCII keeps \w and \s off the Unicode
+# tables
+_FIELD_START_RE = re.compile(r"^\s*(\w+)\s*=\s*", re.MULTILINE | re.ASCII)
 
 
 def _extract_value(raw: str) -> str:
@@ -80,14 +142,23 @@ def _extract_value(raw: str) -> str:
     """
     raw = raw.strip()
     if raw.startswith("{"):
-        depth = 0
-        for i, ch in enumerate(raw):
-            if ch == "{":
-                depth += 1
-            elif ch == "}":
+        depth = 1
+        pos = 1
+        # same find-based brace scan as _iter_entries: only braces are
+        # visited, in C, instead of every character in Python
+        while True:
+            next_close = raw.find("}", pos)
+            if next_close == -1:
+                break
+            next_open = raw.find("{", pos, next_close)
+            if next_open == -1:
                 depth -= 1
                 if depth == 0:
-                    return raw[1:i]
+                    return raw[1:next_close]
+                pos = next_close + 1
+            else:
+                depth += 1
+                pos = next_open + 1
     elif raw.startswith('"'):
         end = raw.index('"', 1)
         return raw[1:end]
@@ -97,14 +168,19 @@ def _extract_value(raw: str) -> str:
 
 
 def _parse_fields(body: str) -> dict[str, str]:
-    """Parse BibTeX fields supporting braced, quoted, and bare values."""
-    matches = list(_FIELD_START_RE.finditer(body))
+    """Parse BibTeX fields supporting braced, quoted, and bare values.
+
+    A single forward pass over the field starts; each value ends where the
+    next field begins, so only the previous match needs to be remembered.
+    """
     fields: dict[str, str] = {}
-    for i, m in enumerate(matches):
-        name = m.group(1).lower()
-        val_start = m.end()
-        val_end = matches[i + 1].start() if i + 1 < len(matches) else len(body)
-        fields[name] = _extract_value(body[val_start:val_end])
+    prev: tuple[str, int] | None = None
+    for m in _FIELD_START_RE.finditer(body):
+        if prev is not None:
+            fields[prev[0]] = _extract_value(body[prev[1] : m.start()])
+        prev = (m.group(1).lower(), m.end())
+    if prev is not None:
+        fields[prev[0]] = _extract_value(body[prev[1] :])
     return fields
 
 
@@ -180,7 +256,9 @@ def _thesis_kwargs(
     kwargs: dict[str, Any] = {}
     if "school" in fields:
         kwargs["school"] = fields["school"]
-    kwargs["thesis_type"] = "phd" if entry_type == "phdthesis" else "masters"
+    kwargs["thesis_type"] = (
+        _THESIS_PHD if entry_type == "phdthesis" else _THESIS_MASTERS
+    )
     return kwargs
 
 
@@ -195,17 +273,46 @@ def _software_kwargs(fields: dict[str, str]) -> dict[str, Any]:
 
 _KwargsFunc = Callable[[dict[str, str]], dict[str, Any]]
 
-_TYPE_KWARGS: dict[type[CitationBase], _KwargsFunc] = {
-    Article: _article_kwargs,
-    Book: _book_kwargs,
-    InProceedings: _inproceedings_kwargs,
-    TechReport: _techreport_kwargs,
-    Software: _software_kwargs,
+# per-type extras keyed by entry type so _build_citation resolves both the
+# class and its kwargs helper with single hash lookups; Misc has no extras
+_TYPE_KWARGS: dict[str, _KwargsFunc] = {
+    "article": _article_kwargs,
+    "book": _book_kwargs,
+    "inproceedings": _inproceedings_kwargs,
+    "techreport": _techreport_kwargs,
+    "phdthesis": functools.partial(_thesis_kwargs, entry_type="phdthesis"),
+    "mastersthesis": functools.partial(_thesis_kwargs, entry_type="mastersthesis"),
+    "software": _software_kwargs,
 }
 
 
-def from_bibtex_string(bibtex: str) -> CitationBase:
-    """Parse a single BibTeX record and return the corresponding object."""
+def _build_citation(entry_type_raw: str, cite_key: str, body: str) -> CitationBase:
+    """Construct a citation from one extracted ``(type, key, body)`` entry."""
+    entry_type = sys.intern(entry_type_raw.lower())
+
+    cls = _TYPE_MAP.get(entry_type)
+    if cls is None:
+        msg = f"Unsupported BibTeX entry type: @{entry_type}"
+        raise ValueError(msg)
+
+    fields = _parse_fields(body)
+    kwargs = _common_kwargs(fields, cite_key)
+
+    extras = _TYPE_KWARGS.get(entry_type)
+    if extras is not None:
+        kwargs.update(extras(fields))
+
+    return cls(**kwargs)
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_single(bibtex: str) -> CitationBase:
+    """Parse a single BibTeX record; memoized on the input string."""
+    if "@" not in bibtex:
+        # cheap containment check rejects plainly non-BibTeX input before
+        # the string is encoded and scanned
+        msg = "No BibTeX entry found in input string"
+        raise ValueError(msg)
     entries = _extract_entries(bibtex)
     if not entries:
         msg = "No BibTeX entry found in input string"
@@ -214,20 +321,43 @@ def from_bibtex_string(bibtex: str) -> CitationBase:
         msg = "Multiple BibTeX entries found; only single-record strings are supported"
         raise ValueError(msg)
 
-    entry_type_raw, cite_key, body = entries[0]
-    entry_type = entry_type_raw.lower()
+    return _build_citation(*entries[0])
 
-    if entry_type not in _TYPE_MAP:
-        msg = f"Unsupported BibTeX entry type: @{entry_type}"
-        raise ValueError(msg)
 
-    cls = _TYPE_MAP[entry_type]
-    fields = _parse_fields(body)
-    kwargs = _common_kwargs(fields, cite_key)
+def from_bibtex_string(bibtex: str) -> CitationBase:
+    """Parse a single BibTeX record and return the corresponding object.
 
-    if cls is Thesis:
-        kwargs.update(_thesis_kwargs(fields, entry_type))
-    elif cls in _TYPE_KWARGS:
-        kwargs.update(_TYPE_KWARGS[cls](fields))
+    Repeated parses of the same string are served from an LRU cache; each
+    call returns a fresh copy so callers may mutate the result freely.
+    """
+    return _parse_single(bibtex)._copy()  # noqa: SLF001 -- detach from the cached instance
 
-    return cls(**kwargs)
+
+from_bibtex_string.cache_clear = _parse_single.cache_clear  # type: ignore[attr-defined]
+
+
+def from_bibtex_stream(bibtex: str | bytes) -> Iterator[CitationBase]:
+    """Yield citations from text holding any number of BibTeX records.
+
+    Citations are built and yielded lazily as each record is found. ``str``
+    input is UTF-8 encoded once up front; pass ``bytes`` to skip that copy.
+    """
+    buf = bibtex.encode() if isinstance(bibtex, str) else bibtex
+    for entry in _iter_entries(buf):
+        yield _build_citation(*entry)
+
+
+def from_bibtex_file(path: str | Path) -> list[CitationBase]:
+    """Read a ``.bib`` file and return all citations it contains.
+
+    The file is memory-mapped rather than read into a bytes object, so the
+    kernel pages it in on demand and only the substrings that end up in
+    citations are decoded to ``str``.
+    """
+    with Path(path).open("rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return []
+        with buf:
+            return [_build_citation(*entry) for entry in _iter_entries(buf)]
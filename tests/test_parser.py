@@ -10,6 +10,8 @@ from citeable import (
     Software,
     TechReport,
     Thesis,
+    from_bibtex_file,
+    from_bibtex_stream,
     from_bibtex_string,
 )
 
@@ -185,6 +187,32 @@ def test_parse_single_name_among_multiple_authors():
     assert cite.author == ["Plato", "Smith, Jane"]
 
 
+def test_parse_braced_corporate_author():
+    """An ``and`` inside a brace-protected name is not an author delimiter."""
+    cite = from_bibtex_string("""
+@misc{Consortium.2024,
+  author = {{Data and Code Consortium} and Jane Smith},
+  title  = {A Report},
+  year   = {2024},
+}
+""")
+    assert cite.author == ["{Data and Code Consortium}", "Smith, Jane"]
+
+
+def test_parse_bare_value_with_comma():
+    cite = from_bibtex_string("""
+@article{Smith.2024,
+  author  = {Smith, John},
+  title   = {A Paper},
+  journal = {Nature},
+  year    = 2024,
+  pages   = 100,200
+}
+""")
+    assert cite.year == 2024
+    assert cite.pages == "100,200"
+
+
 def test_parse_preserves_cite_key():
     cite = from_bibtex_string("""
 @misc{my_custom_key,
@@ -271,3 +299,78 @@ def test_parse_multiple_entries():
   year   = {2024},
 }
 """)
+
+
+_TWO_ENTRIES = """
+@misc{A.2024,
+  author = {A, B},
+  title  = {First},
+  year   = {2024},
+}
+@article{C.2023,
+  author  = {C, D},
+  title   = {Second},
+  journal = {J},
+  year    = {2023},
+}
+"""
+
+
+def test_stream_multiple_entries():
+    cites = list(from_bibtex_stream(_TWO_ENTRIES))
+    assert len(cites) == 2
+    assert isinstance(cites[0], Misc)
+    assert isinstance(cites[1], Article)
+    assert [c.key for c in cites] == ["A.2024", "C.2023"]
+
+
+def test_stream_is_lazy():
+    """A valid leading record is yielded before a later record can fail."""
+    stream = from_bibtex_stream("""
+@misc{A.2024,
+  author = {A, B},
+  title  = {First},
+  year   = {2024},
+}
+@unsupported{C.2024,
+  author = {C, D},
+  title  = {Second},
+  year   = {2024},
+}
+""")
+    first = next(stream)
+    assert first.title == "First"
+    with pytest.raises(ValueError, match="Unsupported BibTeX entry type"):
+        next(stream)
+
+
+def test_from_bibtex_file(tmp_path):
+    path = tmp_path / "refs.bib"
+    path.write_text(_TWO_ENTRIES, encoding="utf-8")
+    cites = from_bibtex_file(path)
+    assert len(cites) == 2
+    assert cites[0].author == ["A, B"]
+
+
+def test_from_bibtex_file_non_ascii(tmp_path):
+    """Multi-byte values must decode intact through the mmap'd buffer."""
+    path = tmp_path / "refs.bib"
+    path.write_text(
+        """
+@misc{Muller.2024,
+  author = {Müller, Jürgen},
+  title  = {Größenordnung},
+  year   = {2024},
+}
+""",
+        encoding="utf-8",
+    )
+    cites = from_bibtex_file(path)
+    assert cites[0].author == ["Müller, Jürgen"]
+    assert cites[0].title == "Größenordnung"
+
+
+def test_from_bibtex_file_empty(tmp_path):
+    path = tmp_path / "empty.bib"
+    path.write_text("", encoding="utf-8")
+    assert from_bibtex_file(path) == []
@@ -1,5 +1,6 @@
 """Tests for __str__, __repr__, summary(), and JSON serialisation."""
 
+import json
 import pathlib
 
 import pytest
@@ -504,6 +505,35 @@ def test_from_dict_missing_type() -> None:
         CitationBase.from_dict({"author": ["A"], "title": "T", "year": 2024})
 
 
+def test_from_jsons_missing_optional_fields() -> None:
+    restored = from_jsons(
+        '[{"type": "Misc", "author": ["Smith, Jane"], "title": "T", "year": 2024}]'
+    )
+    assert len(restored) == 1
+    assert restored[0].doi is None
+
+
+def test_from_jsons_empty_author() -> None:
+    with pytest.raises(ValueError, match="at least one author"):
+        from_jsons('[{"type": "Misc", "author": [], "title": "T", "year": 2024}]')
+
+
+def test_from_jsons_null_required_field() -> None:
+    d = Article(author=["A, B"], title="T", year=2024, journal="J").to_dict()
+    d["journal"] = None
+    with pytest.raises(ValueError, match="Article requires 'journal'"):
+        from_jsons(json.dumps([d]))
+
+
+def test_from_jsons_invalid_thesis_type() -> None:
+    d = Thesis(
+        author=["A, B"], title="T", year=2024, school="S", thesis_type="phd"
+    ).to_dict()
+    d["thesis_type"] = "bogus"
+    with pytest.raises(ValueError, match="must be 'phd' or 'masters'"):
+        from_jsons(json.dumps([d]))
+
+
 def test_to_jsons_from_jsons_mixed_types() -> None:
     originals = _make_all_types()
     json_str = to_jsons(originals)